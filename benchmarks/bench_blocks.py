@@ -0,0 +1,275 @@
+"""
+gen_*_block 의 템플릿 기반 구현과 이전 구현(매번 dict 를 새로 조립)을 비교하는 벤치마크.
+
+두 구현의 결과가 json 직렬화 기준으로 동일한지 먼저 확인한 후 호출당 시간을 측정한다.
+(이전 구현의 OrderedDict 는 템플릿 구현에서 같은 순서의 dict 로 대체됨)
+
+사용법::
+
+    python benchmarks/bench_blocks.py [반복횟수]
+"""
+import os
+import sys
+import json
+import timeit
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from nPost import NPOST  # noqa: E402
+
+
+class LegacyBlocks(NPOST):
+    """
+    템플릿 적용 이전의 block 생성 메소드
+    """
+
+    def gen_title_header_block(self, title):
+        header_obj = {}
+        header_obj['title'] = title
+        header_obj['publishDate'] = '1970-01-01T00:00:00.000+0000'  # 등록에 영향을 주지 않음
+        header_obj['background'] = {}
+        header_obj['background']['@ctype'] = 'background'
+        header_obj['background']['color'] = ''
+        header_obj['@ctype'] = 'documentTitle'
+        header_obj['layout'] = 'default'
+        header_obj['isFocused'] = 'false'
+        header_obj['componentStyle'] = {}
+        header_obj['componentStyle']['@ctype'] = 'componentStyle'
+        header_obj['componentStyle']['align'] = 'left'
+        header_obj['componentStyle']['fontFamily'] = 'nanumgothic'
+        header_obj['componentStyle']['fontSize'] = 'D1'
+        header_obj['componentStyle']['fontBold'] = False
+        header_obj['componentStyle']['fontUnderline'] = False
+        header_obj['componentStyle']['fontItalic'] = False
+        header_obj['compId'] = 'documentTitle_9022535151470014076389'
+        header_obj['focusComp'] = False
+
+        return header_obj
+
+    def gen_paragraph_block(self, text):
+
+        if not text:
+            text = ''
+
+        paragraph_obj = {}
+        paragraph_obj['value'] = text
+        paragraph_obj['@ctype'] = 'paragraph'
+        paragraph_obj['layout'] = 'default'
+        paragraph_obj['isFocused'] = False
+        paragraph_obj['componentStyle'] = {}
+        paragraph_obj['componentStyle']['@ctype'] = 'componentStyle'
+        paragraph_obj['componentStyle']['align'] = 'left'
+        paragraph_obj['componentStyle']['fontFamily'] = 'nanumgothic'
+        paragraph_obj['componentStyle']['fontSize'] = 'T3'
+        paragraph_obj['componentStyle']['fontBold'] = False
+        paragraph_obj['componentStyle']['fontUnderline'] = False
+        paragraph_obj['componentStyle']['fontItalic'] = False
+        paragraph_obj['componentStyle']['lineHeight'] = ''
+        paragraph_obj['compId'] = 'paragraph_3801062811469603612800'
+        paragraph_obj['focusComp'] = False
+
+        return paragraph_obj
+
+    def gen_section_title_block(self, subtitle):
+
+        # 특수문자 제거 (필요시 reg 추가하여 처리)
+        #subtitle = re.sub(r'◆', '', subtitle)
+
+        subtitle_obj = {}
+        subtitle_obj['value'] = subtitle.strip()
+        subtitle_obj['@ctype'] = 'quotation'
+        subtitle_obj['layout'] = 'default'
+        subtitle_obj['isFocused'] = False
+        subtitle_obj['componentStyle'] = {}
+        subtitle_obj['componentStyle']['@ctype'] = 'componentStyle'
+        subtitle_obj['componentStyle']['fontSize'] = 'T2'
+        subtitle_obj['componentStyle']['fontBold'] = False
+        subtitle_obj['componentStyle']['fontUnderline'] = False
+        subtitle_obj['componentStyle']['fontItalic'] = False
+        subtitle_obj['compId'] = 'quotation_2711786871470204596536'
+        subtitle_obj['focusComp'] = False
+
+        return subtitle_obj
+
+    def gen_image_block(self, image, represent):
+        img_obj = {}
+        img_obj['src'] = 'http://post.phinf.naver.net' + image['url'] + '?type=w1200'
+        img_obj['width'] = image['width']
+        img_obj['height'] = image['height']
+        img_obj['originalWidth'] = image['width']
+        img_obj['originalHeight'] = image['height']
+        img_obj['alt'] = image['fileName']
+        img_obj['caption'] = ''
+
+        if 'naCaption' in image:  # 캡션이 있다면 추가
+            img_obj['caption'] = image['naCaption']
+
+        img_obj['path'] = image['thumbnail']
+        img_obj['domain'] = 'http://post.phinf.naver.net/'
+        img_obj['uploadedLocal'] = True
+        img_obj['offsetCenterXRatio'] = 0
+        img_obj['offsetCenterYRatio'] = 0
+        img_obj['backgroundPositionX'] = '50%'
+        img_obj['backgroundPositionY'] = '50%'
+        img_obj['fileSize'] = image['fileSize']
+        img_obj['represent'] = represent
+        img_obj['fileName'] = image['fileName']
+        img_obj['animationGif'] = False
+
+        if 'gallery_link' in image:  # 화보라면 링크 처리
+            img_obj['link'] = image['gallery_link']
+
+        img_obj['@ctype'] = 'image'
+        img_obj['layout'] = 'default'
+        img_obj['isFocused'] = False
+        img_obj['componentStyle'] = {}
+        img_obj['componentStyle']['@ctype'] = 'componentStyle'
+        img_obj['componentStyle']['align'] = 'justify'
+        img_obj['componentStyle']['fontBold'] = False
+        img_obj['componentStyle']['fontUnderline'] = False
+        img_obj['componentStyle']['fontItalic'] = False
+        img_obj['compId'] = 'image_5233948931470204596538'
+        img_obj['focusComp'] = False
+
+        return img_obj
+
+    def gen_video_block(self, info, mtype):
+        video = {}
+
+        if mtype == 'tvCast':  # TVCast 영상일 경우
+            video['vid'] = info['videoId']
+            video['caption'] = ''
+            video['thumbnail'] = {}
+            video['thumbnail']['@ctype'] = 'simpleThumbnail'
+            video['thumbnail']['src'] = info['thumbnail']
+            video['thumbnail']['alt'] = info['title']
+            video['source'] = info['videoTemplateSource']
+            video['template'] = info['videoTemplate']
+            video['vender'] = 'TVcast'
+        else:  # 유튜브 영상일 경우
+            # vid and thumbnail url parse
+            vid, thumb_url = self.get_youtube_video_info(info['src'])
+
+            video['vid'] = vid
+            video['caption'] = ''
+            video['thumbnail'] = {}
+            video['thumbnail']['@ctype'] = 'simpleThumbnail'
+            video['thumbnail']['src'] = thumb_url
+            video['thumbnail']['alt'] = ''
+            video['source'] = info['src']
+            video['template'] = info['html']
+            video['vender'] = 'youtube'
+
+        video['@ctype'] = 'video'
+        video['layout'] = 'default'
+        video['isFocused'] = False
+        video['uploadedLocal'] = True
+        video['represent'] = False
+        video['fileSize'] = 0
+        video['componentStyle'] = {}
+        video['componentStyle']['@ctype'] = 'componentStyle'
+        video['componentStyle']['fontBold'] = False
+        video['componentStyle']['fontUnderline'] = False
+        video['componentStyle']['fontItalic'] = False
+        video['compId'] = 'video_7546429391470204596539'
+        video['focusComp'] = False
+
+        return video
+
+    def gen_byline_block(self, name, email):
+
+        value = '<span style="color: rgb(0, 0, 0);' \
+                '">' + name + '</span><span class="Apple-converted-space" ' \
+                'style="color: rgb(0, 0, 0);">&nbsp;</span>' \
+                '<a href="mailto:' + email + '" style="color: rgb(96, 140, 186) ' \
+                '!important">' + email + '</a><span class="Apple-converted-space" ' \
+                'style="color: rgb(0, 0, 0);"></span><span style="color: rgb(0, 0, 0);">' \
+                '&lt;Your Company(</span><a href="http://YourComapany.com/" target="_blank" ' \
+                'style="color: rgb(96, 140, 186) !important">http://YourCompany.com</a><span style="color:' \
+                ' rgb(0, 0, 0);">) &gt;</span></br>'
+
+        byline = OrderedDict()
+        byline['value'] = value
+        byline['@ctype'] = 'paragraph'
+        byline['layout'] = 'default'
+        byline['isFocused'] = False
+        byline['componentStyle'] = OrderedDict()
+        byline['componentStyle']['@ctype'] = 'componentStyle'
+        byline['componentStyle']['align'] = 'left'
+        byline['componentStyle']['fontFamily'] = 'nanumgothic'
+        byline['componentStyle']['fontSize'] = 'T3'
+        byline['componentStyle']['fontBold'] = False
+        byline['componentStyle']['fontUnderline'] = False
+        byline['componentStyle']['fontItalic'] = False
+        byline['componentStyle']['lineHeight'] = ''
+        byline['compId'] = 'paragraph_3801062811469603612800'
+        byline['focusComp'] = False
+
+        return byline
+
+    def gen_related_article_block(self, tags):
+        rel_object = OrderedDict()
+        rel_object['title'] = tags['og:title']
+        rel_object['link'] = tags['og:url']
+        rel_object['domain'] = 'www.motorgraph.com'
+        rel_object['thumbnail'] = OrderedDict()
+        rel_object['thumbnail']['@ctype'] = 'thumbnail'
+        rel_object['thumbnail']['src'] = tags['og:image']
+        rel_object['thumbnail']['width'] = tags['og:image:width']
+        rel_object['thumbnail']['height'] = tags['og:image:height']
+        rel_object['desc'] = tags['og:description']
+        rel_object['isVideo'] = False
+        rel_object['@ctype'] = 'oglink'
+        rel_object['layout'] = 'og_bSize'
+        rel_object['isFocused'] = False
+        rel_object['componentStyle'] = OrderedDict()
+        rel_object['componentStyle']['@ctype'] = 'componentStyle'
+        rel_object['componentStyle']['align'] = 'center'
+        rel_object['compId'] = 'oglink_6562828561470302602492'
+        rel_object['focusComp'] = False
+
+        return rel_object
+
+
+IMAGE = {'url': '/MjAxNjA4MDFfMjU0/MDAxNDcwMDE0.jpg', 'width': '1200', 'height': '800',
+         'fileName': 'photo.jpg', 'thumbnail': '/MjAxNjA4MDFfMjU0/MDAxNDcwMDE0.jpg', 'fileSize': '183920'}
+GALLERY_IMAGE = dict(IMAGE, naCaption='캡션', gallery_link='http://www.motorgraph.com/gallery/1')
+TVCAST = {'videoId': '1234567', 'thumbnail': 'http://tvcast/thumb.jpg', 'title': '영상',
+          'videoTemplateSource': 'http://tvcast/src', 'videoTemplate': '<iframe></iframe>'}
+YOUTUBE = {'src': 'http://www.youtube.com/watch?v=_oPAwA_Udwc&feature=feedu', 'html': '<iframe></iframe>'}
+TAGS = {'og:title': '관련기사', 'og:url': 'http://www.motorgraph.com/news/1', 'og:image': 'http://img/1.jpg',
+        'og:image:width': '600', 'og:image:height': '400', 'og:description': '설명'}
+
+CASES = [
+    ('gen_title_header_block', ('제목',)),
+    ('gen_paragraph_block', ('본문 문단입니다.' * 10,)),
+    ('gen_section_title_block', ('  중간 제목  ',)),
+    ('gen_image_block', (IMAGE, False)),
+    ('gen_image_block', (GALLERY_IMAGE, True)),
+    ('gen_video_block', (TVCAST, 'tvCast')),
+    ('gen_video_block', (YOUTUBE, 'youtube')),
+    ('gen_byline_block', ('홍길동', 'gildong@example.com')),
+    ('gen_related_article_block', (TAGS,)),
+]
+
+
+def main(number=100000):
+    current = NPOST.__new__(NPOST)
+    legacy = LegacyBlocks.__new__(LegacyBlocks)
+
+    print('%-28s %12s %12s %8s' % ('block', 'legacy(us)', 'template(us)', 'speedup'))
+    for name, args in CASES:
+        new_block = getattr(current, name)(*args)
+        old_block = getattr(legacy, name)(*args)
+        assert json.dumps(new_block) == json.dumps(old_block), name
+
+        old_time = min(timeit.repeat(lambda: getattr(legacy, name)(*args), number=number, repeat=3))
+        new_time = min(timeit.repeat(lambda: getattr(current, name)(*args), number=number, repeat=3))
+
+        print('%-28s %12.3f %12.3f %7.2fx' % (name, old_time / number * 1e6, new_time / number * 1e6,
+                                               old_time / new_time))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
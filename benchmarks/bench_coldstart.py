@@ -0,0 +1,104 @@
+"""
+짧게 실행되는 작업자(serverless 등)의 시작 비용을 측정하는 벤치마크.
+
+- import: 새 인터프리터에서 nPost import 시간 (중간값)
+  eager 는 이전처럼 무거운 모듈을 모두 미리 import 한 경우이다.
+- 생성: 대역 서버(mock_naver.py)의 로그인 지연을 두고 NPOST 생성 시간과 첫 포스트 등록까지의 시간
+- publish_date: 호출당 시간 (pytz 로 매번 timezone 을 찾는 이전 방식과 비교, pytz 가 없으면 생략)
+
+사용법::
+
+    python benchmarks/bench_coldstart.py [반복횟수] [로그인지연(초)]
+"""
+import os
+import sys
+import time
+import json
+import timeit
+import datetime
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# 이전 버전의 nPost 가 import 시점에 읽어 들이던 모듈
+EAGER_MODULES = ['asyncio', 'sqlite3', 'hashlib', 'pickle', 'mimetypes', 'xml.parsers.expat',
+                 'concurrent.futures.process', 'pytz', 'xmltodict', 'PIL.Image', 'PIL.ImageOps']
+
+IMPORT_CODE = '''
+import sys, time, json
+started = time.perf_counter()
+for name in {eager!r}:
+    try:
+        __import__(name)
+    except ImportError:
+        pass
+import nPost
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, [name for name in {eager!r} if name in sys.modules]]))
+'''
+
+
+def import_time(eager, number):
+    code = IMPORT_CODE.format(eager=EAGER_MODULES if eager else [])
+    times = []
+    loaded = []
+    for _ in range(number):
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+        elapsed, loaded = json.loads(output)
+        times.append(elapsed)
+
+    return statistics.median(times), loaded
+
+
+def construction(base_url, lazy):
+    import nPost
+
+    endpoints = nPost.EndpointRegistry(base_url=base_url)
+    started = time.monotonic()
+    npost = nPost.NPOST('bench', 'bench', endpoints=endpoints, lazy_login=lazy)
+    created = time.monotonic() - started
+    npost.send_post('{}', nPost.Document('제목', [nPost.Paragraph('본문')]), 'writePost')
+
+    return created, time.monotonic() - started
+
+
+def main(number=10, login_latency=0.2):
+    import nPost
+    from mock_naver import MockNaverServer
+
+    eager_time, _ = import_time(True, number)
+    lazy_time, loaded = import_time(False, number)
+    print('import nPost (median of %d)' % number)
+    print('  eager: %.1f ms' % (eager_time * 1e3))
+    print('  lazy:  %.1f ms  (deferred modules loaded: %s)' % (lazy_time * 1e3, ', '.join(loaded) or 'none'))
+
+    server = MockNaverServer(latency={'login': login_latency}).start()
+    print()
+    print('NPOST() with %.0f ms login latency' % (login_latency * 1e3))
+    for name, lazy in (('eager login', False), ('lazy_login', True)):
+        created, first = construction(server.base_url, lazy)
+        print('  %-12s created in %7.1f ms, first post in %7.1f ms' % (name, created * 1e3, first * 1e3))
+    server.stop()
+
+    print()
+    current = min(timeit.repeat(nPost.publish_date, number=10000, repeat=3)) / 10000
+    print('publish_date: %.2f us' % (current * 1e6))
+    try:
+        import pytz
+    except ImportError:
+        return
+
+    def legacy():
+        return datetime.datetime.now(pytz.timezone('Asia/Seoul')).strftime('%Y-%m-%dT%H:%M:%S%z')
+
+    assert legacy()[-5:] == nPost.publish_date()[-5:]
+    legacy_time = min(timeit.repeat(legacy, number=10000, repeat=3)) / 10000
+    print('publish_date (pytz lookup per call): %.2f us' % (legacy_time * 1e6))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:3]
+    main(int(args[0]) if args else 10, float(args[1]) if len(args) > 1 else 0.2)
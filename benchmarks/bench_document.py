@@ -0,0 +1,96 @@
+"""
+큰 포스트 본문을 만드는 두 방법을 비교하는 벤치마크.
+
+- dict: gen_*_block 으로 dictionary 를 조립한 후 json.dumps
+- Document: __slots__ 모델을 Document.dumps 로 한번에 직렬화
+
+두 결과가 같은지 먼저 확인한 후 문서당 시간과 tracemalloc 최대 메모리를 측정한다.
+
+사용법::
+
+    python benchmarks/bench_document.py [block수] [반복횟수]
+"""
+import os
+import sys
+import json
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import nPost  # noqa: E402
+from bench_blocks import IMAGE, GALLERY_IMAGE, TVCAST, YOUTUBE, TAGS  # noqa: E402
+
+DATE = '2016-08-01T10:14:45+0900'
+TEXT = '본문 문단입니다. <b>강조</b> & "따옴표"' * 8
+
+
+def build_dicts(npost, blocks):
+    info = npost.gen_info_block('제목')
+    info['document']['publishDate'] = DATE
+    components = [npost.gen_title_header_block('제목')]
+    for index in range(blocks):
+        kind = index % 8
+        if kind == 3:
+            components.append(npost.gen_image_block(GALLERY_IMAGE if index % 16 == 3 else IMAGE, index == 3))
+        elif kind == 5:
+            components.append(npost.gen_section_title_block('중간 제목'))
+        elif kind == 7:
+            components.append(npost.gen_video_block(TVCAST, 'tvCast') if index % 16 == 7 else
+                              npost.gen_video_block(YOUTUBE, 'youtube'))
+        else:
+            components.append(npost.gen_paragraph_block(TEXT))
+    components.append(npost.gen_byline_block('홍길동', 'gildong@example.com'))
+    components.append(npost.gen_related_article_block(TAGS))
+    info['document']['components'] = components
+    info['metaData'] = npost.gen_meta_data_block('모터그래프,자동차', '1234')
+
+    return json.dumps(info)
+
+
+def build_document(blocks):
+    document = nPost.Document('제목', [nPost.TitleHeader('제목')], meta=nPost.MetaData('모터그래프,자동차', '1234'),
+                              date=DATE)
+    for index in range(blocks):
+        kind = index % 8
+        if kind == 3:
+            document.append(nPost.Image.from_upload(GALLERY_IMAGE if index % 16 == 3 else IMAGE, index == 3))
+        elif kind == 5:
+            document.append(nPost.Quotation('중간 제목'))
+        elif kind == 7:
+            document.append(nPost.Video.tvcast(TVCAST) if index % 16 == 7 else nPost.Video.youtube(YOUTUBE))
+        else:
+            document.append(nPost.Paragraph(TEXT))
+    document.append(nPost.Byline('홍길동', 'gildong@example.com'))
+    document.append(nPost.OgLink.from_tags(TAGS))
+
+    return document.dumps()
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+
+def main(blocks=2000, number=20):
+    npost = nPost.NPOST.__new__(nPost.NPOST)
+    assert build_dicts(npost, blocks) == build_document(blocks)
+
+    dict_time = min(timeit.repeat(lambda: build_dicts(npost, blocks), number=number, repeat=3)) / number
+    doc_time = min(timeit.repeat(lambda: build_document(blocks), number=number, repeat=3)) / number
+    dict_peak = peak_memory(lambda: build_dicts(npost, blocks))
+    doc_peak = peak_memory(lambda: build_document(blocks))
+
+    print('blocks: %d, json: %d bytes' % (blocks, len(build_document(blocks))))
+    print('%-10s %12s %12s' % ('', 'time(ms)', 'peak(KiB)'))
+    print('%-10s %12.2f %12.1f' % ('dict', dict_time * 1e3, dict_peak / 1024))
+    print('%-10s %12.2f %12.1f' % ('Document', doc_time * 1e3, doc_peak / 1024))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
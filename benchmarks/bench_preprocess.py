@@ -0,0 +1,86 @@
+"""
+이미지 전처리(ImagePreprocessor) 적용 전후의 업로드를 비교하는 벤치마크.
+
+카메라 원본 크기의 사진 같은 JPEG 를 만들어 대역 서버(mock_naver.py)로 업로드하고
+전송 byte 수와 전체 시간을 출력한다. 전처리 결과 캐시를 사용한 재업로드 시간도 함께 측정한다.
+(Pillow 가 설치되어 있어야 함)
+
+사용법::
+
+    python benchmarks/bench_preprocess.py [이미지수] [가로] [세로]
+"""
+import io
+import os
+import sys
+import time
+import random
+import tempfile
+
+from PIL import Image, ImageFilter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import nPost  # noqa: E402
+from mock_naver import MockNaverServer  # noqa: E402
+
+
+def make_photo(width, height, seed):
+    """
+    사진과 비슷하게 압축되는 JPEG (그라디언트 + 잡음, EXIF 포함)
+    """
+    rng = random.Random(seed)
+    base = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    noise = Image.effect_noise((width, height), 24).convert('RGB')
+    image = Image.blend(base, noise, 0.3).filter(ImageFilter.GaussianBlur(1))
+    image = Image.blend(image, Image.new('RGB', (width, height), tuple(rng.randrange(256) for _ in range(3))), 0.2)
+
+    exif = Image.Exif()
+    exif[0x010F] = 'Benchmark Camera'
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=95, exif=exif)
+
+    return buffer.getvalue()
+
+
+def upload(base_url, paths, preprocessor=None):
+    metrics = nPost.MetricsAggregator()
+    npost = nPost.NPOST('bench', 'bench', endpoints=nPost.EndpointRegistry(base_url=base_url), observer=metrics,
+                        image_preprocessor=preprocessor)
+    npost.get_sessionkey()
+
+    started = time.monotonic()
+    results = npost.send_image_files(paths)
+    elapsed = time.monotonic() - started
+    assert not [result for result in results if isinstance(result, Exception)]
+
+    return elapsed, metrics.summary()['upload']['request_bytes']
+
+
+def main(count=8, width=6000, height=4000):
+    server = MockNaverServer().start()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for n in range(count):
+            path = os.path.join(directory, 'photo%d.jpg' % n)
+            with open(path, 'wb') as f:
+                f.write(make_photo(width, height, n))
+            paths.append(path)
+        source = sum(os.path.getsize(path) for path in paths)
+
+        print('%d images %dx%d, %.1f MiB' % (count, width, height, source / 1048576.0))
+        print('%-14s %10s %12s' % ('', 'time(s)', 'sent(MiB)'))
+        elapsed, sent = upload(server.base_url, paths)
+        print('%-14s %10.2f %12.2f' % ('original', elapsed, sent / 1048576.0))
+
+        with nPost.ImagePreprocessor() as preprocessor:
+            elapsed, sent = upload(server.base_url, paths, preprocessor)
+            print('%-14s %10.2f %12.2f' % ('preprocess', elapsed, sent / 1048576.0))
+            elapsed, sent = upload(server.base_url, paths, preprocessor)
+            print('%-14s %10.2f %12.2f' % ('cached', elapsed, sent / 1048576.0))
+
+    server.stop()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,153 @@
+"""
+네이버 포스트 대역 서버(mock_naver.py)를 상대로 포스트 등록 전체 과정을 측정하는 벤치마크.
+
+포스트마다 본문 문단, 이미지(URL 에서 가져와 업로드), TV캐스트 영상, 관련기사를 포함한 문서를
+PublishQueue 로 등록하고 다음을 출력한다.
+
+- posts/sec, images/sec
+- 포스트 등록 시간 p50/p99
+- 최대 RSS
+- endpoint 별 요청 수와 응답 시간 p50/p99 (MetricsAggregator)
+
+대역 서버를 같은 프로세스에서 띄우면 최대 RSS 에 서버 메모리도 포함되므로
+정확한 메모리 측정이 필요하면 서버를 따로 실행하고 --server 로 지정한다.
+
+사용법::
+
+    python benchmarks/bench_publish.py --posts 200 --images 4 --workers 8 --latency 0.02 --error-rate 0.01
+    python benchmarks/mock_naver.py 8080 &
+    python benchmarks/bench_publish.py --server http://127.0.0.1:8080
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import nPost  # noqa: E402
+from mock_naver import MockNaverServer  # noqa: E402
+
+PARAGRAPH = ('자동차 업계는 전동화 전환에 속도를 내고 있다. 올해 출시된 신차 가운데 절반 이상이 '
+             '하이브리드 또는 전기차이며, 충전 인프라 확충도 함께 진행되고 있다. ') * 4
+
+
+def build_document(images, videos, links):
+    """
+    업로드/조회 결과로 포스트 본문을 만든다. (PublishJob.content)
+    """
+    document = nPost.Document('벤치마크 기사', [nPost.TitleHeader('벤치마크 기사')],
+                              meta=nPost.MetaData('모터그래프,벤치마크'))
+    for index in range(20):
+        if index % 5 == 2:
+            document.append(nPost.Quotation('중간 제목 %d' % index))
+        document.append(nPost.Paragraph(PARAGRAPH))
+        if index % 5 == 0 and images:
+            document.append(nPost.Image.from_upload(images.pop(0), represent=index == 0))
+
+    document.extend(nPost.Image.from_upload(image) for image in images)
+    document.extend(nPost.Video.tvcast(video) for video in videos)
+    document.append(nPost.Byline('홍길동', 'gildong@example.com'))
+    document.extend(nPost.OgLink.from_tags(tags) for tags in links)
+
+    return document
+
+
+def make_jobs(npost, base_url, posts, images, videos, links):
+    preview = json.dumps(npost.gen_preview_block('벤치마크 기사 요약'))
+    for n in range(posts):
+        yield nPost.PublishJob(
+            preview, build_document,
+            images=['%s/image/%d-%d.jpg' % (base_url, n, k) for k in range(images)],
+            videos=['http://tv.naver.com/v/%d%d' % (n, k) for k in range(videos)],
+            links=['%s/article/%d' % (base_url, n * 10 + k) for k in range(links)],
+            job_id=n)
+
+
+def peak_rss():
+    """
+    :return: 최대 RSS(MiB), 측정할 수 없으면 None
+    """
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 byte, 그 외는 KiB 단위
+    return rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else rss / 1024.0
+
+
+def ms(value):
+    return '-' if value is None else '%.1f' % (value * 1e3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='publish benchmark against a local Naver stand-in')
+    parser.add_argument('--posts', type=int, default=100)
+    parser.add_argument('--images', type=int, default=4, help='images per post')
+    parser.add_argument('--videos', type=int, default=1, help='tvcast videos per post')
+    parser.add_argument('--links', type=int, default=2, help='related articles per post')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--max-pending', type=int, default=32)
+    parser.add_argument('--latency', type=float, default=0.01, help='server latency per request (s)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='random extra latency (s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 ratio per request')
+    parser.add_argument('--image-size', type=int, default=200 * 1024)
+    parser.add_argument('--server', help='use an already running mock server (base URL)')
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.server
+    if base_url is None:
+        # 로그인은 오류 주입 대상에서 제외
+        error_rate = {endpoint: args.error_rate for endpoint in
+                      ('sessionKey', 'upload', 'prePost', 'writePost', 'updatePost', 'tvCast', 'image', 'article')}
+        server = MockNaverServer(latency=args.latency, jitter=args.jitter, error_rate=error_rate,
+                                 image_size=args.image_size).start()
+        base_url = server.base_url
+
+    metrics = nPost.MetricsAggregator()
+    transport = nPost.HTTPTransport(pool_size=args.workers * 2)
+    npost = nPost.NPOST('bench', 'bench', transport=transport, observer=metrics,
+                        endpoints=nPost.EndpointRegistry(base_url=base_url))
+    retry = nPost.RetryPolicy(retries=3, base_delay=0.05, max_delay=1)
+
+    started = time.monotonic()
+    results = []
+    with nPost.PublishQueue(npost, workers=args.workers, max_pending=args.max_pending, retry=retry) as queue:
+        for result in queue.drain(make_jobs(npost, base_url, args.posts, args.images, args.videos, args.links)):
+            results.append(result)
+    elapsed = time.monotonic() - started
+
+    succeeded = [result for result in results if result.ok]
+    latencies = sorted(result.latency for result in succeeded)
+
+    print('posts: %d ok, %d failed, %d retries in %.2fs' % (len(succeeded), len(results) - len(succeeded),
+                                                            sum(result.retries for result in results), elapsed))
+    print('posts/sec: %.1f  images/sec: %.1f' % (len(succeeded) / elapsed, len(succeeded) * args.images / elapsed))
+    print('post latency p50: %s ms  p99: %s ms' % (ms(nPost.percentile(latencies, 0.5)),
+                                                   ms(nPost.percentile(latencies, 0.99))))
+    rss = peak_rss()
+    print('peak RSS: %s MiB%s' % ('-' if rss is None else '%.1f' % rss,
+                                  ' (includes in-process mock server)' if server is not None else ''))
+    print('connections: %s' % transport.get_stats()['total'])
+
+    print()
+    print('%-14s %8s %8s %10s %10s %12s' % ('endpoint', 'requests', 'errors', 'p50(ms)', 'p99(ms)', 'sent(KiB)'))
+    for label, summary in sorted(metrics.summary().items()):
+        total = summary['stages']['total']
+        print('%-14s %8d %8d %10s %10s %12.1f' % (label, summary['count'], summary['count'] - summary['outcomes'].get('ok', 0),
+                                                  ms(total['p50']), ms(total['p99']), summary['request_bytes'] / 1024.0))
+
+    if server is not None:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+이미지 업로드 응답(XML) 처리 방법을 비교하는 벤치마크.
+
+- xmltodict: 이전 구현 (xmltodict.parse → json.dumps → json.loads 후 item 사용)
+- UploadItem: UploadItem.parse 로 expat 을 사용해 dictionary 로 바로 읽음
+
+응답 처리만 측정한 시간과 image block 생성까지 포함한 시간, 모듈 import 시간을 출력한다.
+(xmltodict 가 설치되어 있어야 함)
+
+사용법::
+
+    python benchmarks/bench_upload_parse.py [반복횟수]
+"""
+import os
+import sys
+import json
+import timeit
+import subprocess
+
+import xmltodict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import nPost  # noqa: E402
+
+RESPONSE = ('<?xml version="1.0" encoding="utf-8"?>'
+            '<item><url>/MjAxNjA4MDFfMjQ2/MDAxNDcwMDEzMjg0OTQy.jpg</url><width>1200</width><height>800</height>'
+            '<fileName>신차 &amp; 시승기.jpg</fileName>'
+            '<thumbnail>/MjAxNjA4MDFfMjQ2/MDAxNDcwMDEzMjg0OTQy.jpg</thumbnail>'
+            '<fileSize>245312</fileSize><naCaption>2017년형 신차</naCaption></item>')
+
+
+def legacy_parse(response):
+    response = xmltodict.parse(response)
+    response = json.dumps(response)
+    response = json.loads(response)
+
+    return response['item']
+
+
+def import_time(module):
+    """
+    새 인터프리터에서 모듈 import 에 걸리는 시간(초)
+    """
+    code = 'import time; t = time.perf_counter(); import %s; print(time.perf_counter() - t)' % module
+    output = subprocess.check_output([sys.executable, '-c', code])
+
+    return float(output)
+
+
+def main(number=20000):
+    npost = nPost.NPOST.__new__(nPost.NPOST)
+
+    legacy = legacy_parse(RESPONSE)
+    item = nPost.UploadItem.parse(RESPONSE)
+    assert dict(item) == legacy
+
+    cases = [
+        ('xmltodict', lambda: legacy_parse(RESPONSE)),
+        ('UploadItem', lambda: nPost.UploadItem.parse(RESPONSE)),
+        ('xmltodict+block', lambda: npost.gen_image_block(legacy_parse(RESPONSE), False)),
+        ('UploadItem+block', lambda: npost.gen_image_block(nPost.UploadItem.parse(RESPONSE), False)),
+    ]
+
+    print('%-18s %12s' % ('', 'time(us)'))
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+        print('%-18s %12.2f' % (name, elapsed * 1e6))
+
+    print()
+    print('import xmltodict: %.1f ms' % (import_time('xmltodict') * 1e3))
+    print('import xml.parsers.expat: %.1f ms' % (import_time('xml.parsers.expat') * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
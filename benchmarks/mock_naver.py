@@ -0,0 +1,306 @@
+"""
+벤치마크용 네이버 포스트 대역 서버.
+
+NPOST 가 사용하는 endpoint 를 흉내낸다.
+
+- 로그인 (nidlogin.login)
+- sessionKey 발급 (PhotoUploader/SessionKey.json)
+- 이미지 업로드 ({sessionKey}/simpleUpload/0, send_image_file 이 읽는 XML 응답)
+- 필터 (Service/PwmFilter.json)
+- 등록/갱신 (documents/write.json, documents/update.json)
+- TV캐스트 영상 정보 (upload/getLinkInfo.nhn)
+- 이미지 원본 (/image/*), og 태그가 있는 관련기사 페이지 (/article/*, ETag 로 조건부 GET 에 304 응답)
+
+전송 계층 테스트(tests/test_transport.py)용 경로
+
+- /echo: 요청 본문을 Content-Length 응답으로 반환
+- /chunked/{n}: n 개 조각의 chunked 응답
+- /redirect/{n}: n 번 리다이렉트 후 응답
+- /drop: 응답 후 keep-alive 커넥션을 알리지 않고 끊음 (서버측에서 끊긴 유휴 커넥션)
+- /hangup: 요청을 받은 후 응답하지 않고 끊음 (요청 처리 후 응답 전에 끊긴 커넥션)
+
+endpoint 별 응답 지연과 오류(503) 비율을 설정할 수 있다.
+프록시로도 동작한다. absolute-form 요청(GET http://host/path)은 경로 부분으로 처리하고
+CONNECT 요청은 대상 호스트와 터널을 연결하며(연결할 수 없으면 502), 둘 다 proxied 에 기록한다.
+rejected_cookies 에 넣은 Cookie 헤더로 인증이 필요한 endpoint 를 요청하면 401 로 응답한다. (만료된 로그인 쿠키)
+NPOST 는 EndpointRegistry(base_url=서버 주소) 로 이 서버에 요청을 보낸다.
+
+사용법::
+
+    python benchmarks/mock_naver.py [port]
+"""
+import os
+import sys
+import re
+import json
+import time
+import random
+import select
+import socket
+import threading
+import contextlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib import parse
+
+UPLOAD_XML = ('<?xml version="1.0" encoding="utf-8"?>'
+              '<item><url>/MjAxNjA4MDFf/{digest}.jpg</url><width>1200</width><height>800</height>'
+              '<fileName>{name}</fileName><thumbnail>/MjAxNjA4MDFf/{digest}.jpg</thumbnail>'
+              '<fileSize>{size}</fileSize></item>')
+
+ARTICLE_HTML = ('<html><head><meta charset="utf-8"><title>{n}</title>'
+                '<meta property="og:title" content="관련기사 {n}">'
+                '<meta property="og:url" content="http://www.motorgraph.com/news/{n}">'
+                '<meta property="og:image" content="http://www.motorgraph.com/image/{n}.jpg">'
+                '<meta property="og:image:width" content="600"><meta property="og:image:height" content="400">'
+                '<meta property="og:description" content="관련기사 설명 {n}"></head>'
+                '<body>{body}</body></html>')
+
+# 요청 경로 → endpoint key (지연/오류 설정과 통계에 사용)
+ROUTES = [
+    ('login', re.compile(r'^/nidlogin\.login')),
+    ('sessionKey', re.compile(r'^/PhotoUploader/SessionKey\.json')),
+    ('upload', re.compile(r'^/[^/]+/simpleUpload/0')),
+    ('prePost', re.compile(r'^/Service/PwmFilter\.json')),
+    ('writePost', re.compile(r'^/documents/write\.json')),
+    ('updatePost', re.compile(r'^/documents/update\.json')),
+    ('tvCast', re.compile(r'^/upload/getLinkInfo\.nhn')),
+    ('image', re.compile(r'^/image/')),
+    ('article', re.compile(r'^/article/')),
+    ('echo', re.compile(r'^/echo')),
+    ('chunked', re.compile(r'^/chunked/')),
+    ('redirect', re.compile(r'^/redirect/')),
+    ('drop', re.compile(r'^/drop')),
+    ('hangup', re.compile(r'^/hangup')),
+]
+
+
+# 로그인 쿠키가 필요한 endpoint
+AUTH_ENDPOINTS = ('sessionKey', 'prePost', 'writePost', 'updatePost', 'tvCast')
+
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def read_body(self):
+        if 'chunked' in (self.headers.get('Transfer-Encoding') or '').lower():
+            parts = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if not size:
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(parts)
+
+        return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+    def respond(self, status, body, content_type='application/json', headers=()):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.dispatch(b'')
+
+    def do_POST(self):
+        self.dispatch(self.read_body())
+
+    def do_CONNECT(self):
+        server = self.server
+        server.count('connect')
+        server.proxied.append((self.command, self.path, self.headers.get('Host'),
+                               self.headers.get('Proxy-Authorization')))
+
+        host, _, port = self.path.rpartition(':')
+        try:
+            upstream = socket.create_connection((host, int(port)), timeout=5)
+        except (OSError, ValueError):
+            return self.respond(502, 'bad gateway', 'text/plain')
+
+        self.send_response(200, 'Connection established')
+        self.end_headers()
+        self.close_connection = True
+
+        with upstream, contextlib.suppress(OSError):
+            sockets = [self.connection, upstream]
+            while True:
+                readable, _, _ = select.select(sockets, [], [], 5)
+                if not readable:
+                    return
+                for sock in readable:
+                    data = sock.recv(65536)
+                    if not data:
+                        return
+                    (upstream if sock is self.connection else self.connection).sendall(data)
+
+    def dispatch(self, body):
+        server = self.server
+        path = self.path
+        if path.startswith('http://'):
+            server.proxied.append((self.command, path, self.headers.get('Host'),
+                                   self.headers.get('Proxy-Authorization')))
+            path = '/' + path.split('/', 3)[3] if path.count('/') >= 3 else '/'
+        endpoint = next((name for name, pattern in ROUTES if pattern.match(path)), None)
+        server.count(endpoint)
+
+        if endpoint is None:
+            return self.respond(404, '{}')
+
+        if endpoint in AUTH_ENDPOINTS and self.headers.get('Cookie') in server.rejected_cookies:
+            return self.respond(401, '{"error": "login"}')
+
+        server.delay(endpoint)
+        if server.should_fail(endpoint):
+            return self.respond(503, '{"error": "busy"}', headers=[('Retry-After', '0')])
+
+        getattr(self, 'handle_' + endpoint)(path, body)
+
+    def handle_login(self, path, body):
+        self.respond(200, 'location.replace("https://nid.naver.com/login/sso/finalize.nhn?url=x")', 'text/html',
+                     headers=[('Set-Cookie', 'NID_AUT=mock; Path=/'), ('Set-Cookie', 'NID_SES=mock; Path=/')])
+
+    def handle_sessionKey(self, path, body):
+        self.respond(200, json.dumps({'result': {'sessionKey': 'mock%d' % self.server.next_id()}}))
+
+    def handle_upload(self, path, body):
+        match = re.search(rb'filename="([^"]*)"', body)
+        name = match.group(1).decode('utf-8', 'replace') if match else 'image.jpg'
+        self.respond(200, UPLOAD_XML.format(digest='%08x' % self.server.next_id(), name=name, size=len(body)),
+                     'text/xml')
+
+    def handle_prePost(self, path, body):
+        self.respond(200, json.dumps({'result': 'ok'}))
+
+    def handle_writePost(self, path, body):
+        self.respond(200, json.dumps({'result': {'documentId': self.server.next_id(), 'size': len(body)}}))
+
+    handle_updatePost = handle_writePost
+
+    def handle_tvCast(self, path, body):
+        url = parse.parse_qs(body.decode('utf-8')).get('url', [''])[0]
+        vid = url.rstrip('/').split('/')[-1]
+        self.respond(200, json.dumps({'videoId': vid, 'title': 'video ' + vid,
+                                      'thumbnail': 'http://tvcast.naver.net/thumb/%s.jpg' % vid,
+                                      'videoTemplateSource': 'http://serviceapi.rmcnmv.naver.com/' + vid,
+                                      'videoTemplate': '<iframe src="http://tv.naver.com/embed/%s"></iframe>' % vid}))
+
+    def handle_image(self, path, body):
+        self.respond(200, self.server.image_bytes, 'image/jpeg')
+
+    def handle_article(self, path, body):
+        n = path.rstrip('/').split('/')[-1]
+        etag = '"article-%s"' % n
+        if self.headers.get('If-None-Match') == etag:
+            return self.respond(304, b'', 'text/html; charset=utf-8', headers=[('ETag', etag)])
+        self.respond(200, ARTICLE_HTML.format(n=n, body='<p>본문</p>' * 200), 'text/html; charset=utf-8',
+                     headers=[('ETag', etag)])
+
+    def handle_echo(self, path, body):
+        self.respond(200, body, 'application/octet-stream')
+
+    def handle_chunked(self, path, body):
+        count = int(path.rstrip('/').split('/')[-1])
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for n in range(count):
+            chunk = ('chunk%d;' % n).encode('ascii')
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        self.wfile.write(b'0\r\n\r\n')
+
+    def handle_redirect(self, path, body):
+        count = int(path.rstrip('/').split('/')[-1])
+        if not count:
+            return self.respond(200, 'done', 'text/plain')
+        self.respond(302, 'moved', 'text/plain', headers=[('Location', '/redirect/%d' % (count - 1))])
+
+    def handle_drop(self, path, body):
+        self.respond(200, 'dropped', 'text/plain')
+        self.close_connection = True
+
+    def handle_hangup(self, path, body):
+        self.close_connection = True
+
+
+class MockNaverServer(ThreadingHTTPServer):
+    """
+    네이버 포스트 대역 서버
+
+    :param tuple address: (host, port), port 가 0 이면 임의 포트
+    :param latency: 응답 지연(초), 숫자 또는 endpoint 별 dictionary
+    :param float jitter: 지연에 더할 임의 시간의 최대값(초)
+    :param error_rate: 503 응답 비율(0 ~ 1), 숫자 또는 endpoint 별 dictionary
+    :param int image_size: /image/* 가 반환할 이미지 크기(byte)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency=0.0, jitter=0.0, error_rate=0.0, image_size=200 * 1024):
+        ThreadingHTTPServer.__init__(self, address, MockNaverHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.image_bytes = b'\xff\xd8\xff\xe0' + os.urandom(max(0, image_size - 4))
+        self.counts = {}
+        self.rejected_cookies = set()
+        self.proxied = []
+        self._id = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return 'http://%s:%d' % self.server_address[:2]
+
+    def setting(self, value, endpoint):
+        if isinstance(value, dict):
+            return value.get(endpoint, 0)
+        return value
+
+    def delay(self, endpoint):
+        seconds = self.setting(self.latency, endpoint)
+        if self.jitter:
+            seconds += random.uniform(0, self.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def should_fail(self, endpoint):
+        rate = self.setting(self.error_rate, endpoint)
+        return rate > 0 and random.random() < rate
+
+    def count(self, endpoint):
+        with self._lock:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+
+    def next_id(self):
+        with self._lock:
+            self._id += 1
+            return self._id
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    server = MockNaverServer(('127.0.0.1', port))
+    print('mock naver server on', server.base_url)
+    server.serve_forever()
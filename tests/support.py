@@ -0,0 +1,45 @@
+"""
+테스트 공통 도구 (benchmarks/mock_naver.py 대역 서버 사용)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+import nPost  # noqa: E402
+from mock_naver import MockNaverServer  # noqa: E402
+
+
+class ServerTestCase(unittest.TestCase):
+    """
+    클래스마다 대역 서버를 하나 실행하는 TestCase
+    """
+
+    # MockNaverServer 생성 인자 (latency, error_rate 등)
+    server_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockNaverServer(**cls.server_options).start()
+        cls.base_url = cls.server.base_url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def url(self, path):
+        return self.base_url + path
+
+    def npost(self, **options):
+        """
+        대역 서버로 요청을 보내는 NPOST
+        """
+        npost = nPost.NPOST('test', 'test', endpoints=nPost.EndpointRegistry(base_url=self.base_url), **options)
+        self.addCleanup(npost.transport.close)
+
+        return npost
+
+    def count(self, endpoint):
+        return self.server.counts.get(endpoint, 0)
@@ -0,0 +1,35 @@
+"""
+Component (Document block) 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import json
+import unittest
+
+from support import nPost
+
+
+class ComponentTest(unittest.TestCase):
+
+    def test_values_is_required(self):
+        class Incomplete(nPost.Component):
+            template = nPost.Paragraph.template
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_blocks_implement_values(self):
+        for cls in nPost.Component.__subclasses__():
+            with self.subTest(cls=cls.__name__):
+                self.assertFalse(cls.__abstractmethods__)
+
+    def test_encode(self):
+        block = nPost.Paragraph('본문')
+
+        self.assertEqual(json.loads(block.encode()), block.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
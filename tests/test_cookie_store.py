@@ -0,0 +1,107 @@
+"""
+CookieStore 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+from support import nPost, ServerTestCase
+
+
+class CookieStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'cookies.json')
+        self.store = nPost.CookieStore(self.path)
+
+    def test_save_and_load(self):
+        self.store.save('user', 'group', 'NID_AUT=a')
+
+        self.assertEqual(self.store.load('user', 'group'), 'NID_AUT=a')
+        self.assertIsNone(self.store.load('user'))
+        self.assertIsNone(self.store.load('other', 'group'))
+
+    def test_expired(self):
+        self.store.save('user', '', 'NID_AUT=a')
+
+        self.assertIsNone(nPost.CookieStore(self.path, max_age=0).load('user'))
+
+    def test_concurrent_saves_are_not_lost(self):
+        # 잠금이 없으면 읽고 고쳐 쓰는 사이에 다른 스레드가 저장한 항목이 사라진다
+        def save(n):
+            store = nPost.CookieStore(self.path)
+            for count in range(20):
+                store.save('user%d' % n, '', 'NID_AUT=%d.%d' % (n, count))
+
+        threads = [threading.Thread(target=save, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n in range(8):
+            self.assertEqual(self.store.load('user%d' % n), 'NID_AUT=%d.19' % n)
+
+    def test_atomic_replace(self):
+        self.store.save('user', '', 'NID_AUT=a')
+
+        # 쓰는 도중 실패하면 이전 파일이 그대로 남고 임시 파일은 지워진다
+        with self.assertRaises(TypeError):
+            self.store.save('user', '', object())
+
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['user|user']['cookies'], 'NID_AUT=a')
+        self.assertEqual(sorted(os.listdir(self.directory)), ['cookies.json', 'cookies.json.lock'])
+
+    def test_discard(self):
+        self.store.save('user', '', 'NID_AUT=a')
+        self.store.discard('user', '', 'NID_AUT=old')
+        self.assertEqual(self.store.load('user'), 'NID_AUT=a')
+
+        self.store.discard('user', '', 'NID_AUT=a')
+        self.assertIsNone(self.store.load('user'))
+
+
+class CookieRejectionTest(ServerTestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.store = nPost.CookieStore(os.path.join(directory, 'cookies.json'))
+
+    def tearDown(self):
+        self.server.rejected_cookies.clear()
+
+    def test_saved_cookie_skips_login(self):
+        self.store.save('test', '', 'NID_AUT=saved')
+        logins = self.count('login')
+
+        npost = self.npost(cookie_store=self.store)
+
+        self.assertEqual(npost.cookies, 'NID_AUT=saved')
+        self.assertEqual(self.count('login'), logins)
+
+    def test_rejected_cookie_is_discarded(self):
+        self.store.save('test', '', 'NID_AUT=stale')
+        self.server.rejected_cookies.add('NID_AUT=stale')
+        npost = self.npost(cookie_store=self.store)
+        logins = self.count('login')
+
+        npost.send_post('{}', nPost.Document('제목', [nPost.Paragraph('본문')]), 'writePost')
+
+        self.assertEqual(self.count('login') - logins, 1)
+        self.assertNotEqual(npost.cookies, 'NID_AUT=stale')
+        self.assertEqual(self.store.load('test'), npost.cookies)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+ImagePreprocessor 테스트 (Pillow 필요)
+
+사용법::
+
+    python -m pytest tests
+"""
+import io
+import os
+import tempfile
+import unittest
+import concurrent.futures
+from unittest import mock
+
+from support import nPost
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def make_image(width=1600, height=900):
+    buffer = io.BytesIO()
+    Image.effect_noise((width, height), 32).convert('RGB').save(buffer, 'JPEG', quality=95)
+
+    return buffer.getvalue()
+
+
+@unittest.skipIf(Image is None, 'Pillow is not installed')
+class ImagePreprocessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.preprocessor = nPost.ImagePreprocessor(min_size=1024)
+        self.addCleanup(self.preprocessor.close)
+        # 작업자에게 전달되는 원본을 확인하기 위해 같은 프로세스에서 실행
+        self.preprocessor._executor = concurrent.futures.ThreadPoolExecutor(1)
+        self.sources = []
+
+        def record(source, *args):
+            self.sources.append(source)
+            return preprocess_image(source, *args)
+
+        preprocess_image = nPost.preprocess_image
+        patcher = mock.patch.object(nPost, 'preprocess_image', record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.data = make_image()
+        fd, self.path = tempfile.mkstemp(suffix='.jpg')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.data)
+        self.addCleanup(os.remove, self.path)
+
+    def test_path_is_passed_to_worker(self):
+        path = self.preprocessor.process(self.path)
+
+        self.assertEqual(self.sources, [self.path])
+        with Image.open(path) as image:
+            self.assertEqual(image.width, self.preprocessor.max_width)
+
+    def test_file_on_disk_is_passed_as_path(self):
+        with open(self.path, 'rb') as f:
+            self.assertIsNotNone(self.preprocessor.process(f))
+            self.assertEqual(f.tell(), 0)
+
+        self.assertEqual(self.sources, [self.path])
+
+    def test_memory_source(self):
+        self.assertIsNotNone(self.preprocessor.process(io.BytesIO(self.data)))
+
+        self.assertEqual(self.sources, [self.data])
+
+    def test_cached_source(self):
+        path = self.preprocessor.process(self.path)
+
+        self.assertEqual(self.preprocessor.process(io.BytesIO(self.data)), path)
+        self.assertEqual(len(self.sources), 1)
+        self.assertEqual(self.preprocessor.get_stats()['hits'], 1)
+
+    def test_small_image_is_skipped(self):
+        self.preprocessor.min_size = len(self.data) + 1
+
+        self.assertIsNone(self.preprocessor.process(memoryview(self.data)))
+        self.assertEqual(self.sources, [])
+        self.assertEqual(self.preprocessor.get_stats()['skipped'], 1)
+
+
+class PreprocessedFilenameTest(unittest.TestCase):
+
+    def test_filename(self):
+        npost = nPost.NPOST('test', 'test', lazy_login=True)
+
+        self.assertEqual(npost._preprocessed_filename('/tmp/photo.png', None, '/cache/abc.jpg'), 'photo.jpg')
+        self.assertEqual(npost._preprocessed_filename(io.BytesIO(b'\x89PNG\r\n\x1a\n'), None, '/cache/abc.webp'),
+                         'image.webp')
+        self.assertEqual(npost._preprocessed_filename(b'', 'name.gif', '/cache/abc.jpg'), 'name.jpg')
+
+    def test_override(self):
+        class NamedNPOST(nPost.NPOST):
+            def image_filename(self, file, filename=None):
+                return 'named.png'
+
+        npost = NamedNPOST('test', 'test', lazy_login=True)
+
+        self.assertEqual(npost._preprocessed_filename(b'', None, '/cache/abc.jpg'), 'named.jpg')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+OGCache 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from support import nPost, ServerTestCase
+
+TAGS = {'og:title': '제목', 'og:url': 'http://example.com/1'}
+
+
+class OGCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'og.sqlite')
+
+    def cache(self, **options):
+        cache = nPost.OGCache(path=self.path, **options)
+        self.addCleanup(cache.close)
+
+        return cache
+
+    def age(self, cache, url, seconds):
+        cache._db.execute('UPDATE og SET fetched = fetched - ? WHERE url = ?', (seconds, url))
+
+    def test_hit_and_miss(self):
+        cache = self.cache()
+        self.assertEqual(cache.lookup('http://example.com/1'), (None, False))
+
+        cache.put('http://example.com/1', TAGS, etag='"1"')
+        entry, fresh = cache.lookup('http://example.com/1')
+
+        self.assertTrue(fresh)
+        self.assertEqual(entry['tags'], TAGS)
+        self.assertEqual(cache.conditional_headers(entry), {'If-None-Match': '"1"'})
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'revalidated': 0, 'misses': 1, 'entries': 1})
+
+    def test_ttl(self):
+        cache = self.cache(ttl=60)
+        cache.put('http://example.com/1', TAGS)
+
+        self.assertFalse(cache.lookup('http://example.com/1', ttl=0)[1])
+        self.assertTrue(cache.lookup('http://example.com/1')[1])
+
+    def test_disk_entry(self):
+        self.cache().put('http://example.com/1', TAGS)
+
+        entry, fresh = self.cache().lookup('http://example.com/1')
+
+        self.assertTrue(fresh)
+        self.assertEqual(entry['tags'], TAGS)
+
+    def test_expired_disk_entry(self):
+        cache = self.cache(max_age=60)
+        cache.put('http://example.com/1', TAGS)
+        self.age(cache, 'http://example.com/1', 61)
+
+        self.assertEqual(self.cache(max_age=60).lookup('http://example.com/1'), (None, False))
+
+    def test_expired_rows_are_pruned(self):
+        cache = self.cache(max_age=60)
+        cache.put('http://example.com/1', TAGS)
+        self.age(cache, 'http://example.com/1', 61)
+
+        # 새 캐시를 열거나 항목을 저장할 때 정리한다
+        self.cache(max_age=60)
+
+        self.assertEqual(cache._db.execute('SELECT COUNT(*) FROM og').fetchone()[0], 0)
+
+    def test_oldest_rows_are_pruned(self):
+        cache = self.cache(max_entries=2)
+        for n in range(3):
+            cache.put('http://example.com/%d' % n, TAGS)
+            self.age(cache, 'http://example.com/%d' % n, 10 - n)
+
+        urls = [row[0] for row in cache._db.execute('SELECT url FROM og ORDER BY url')]
+        self.assertEqual(urls, ['http://example.com/1', 'http://example.com/2'])
+
+
+class CachedOGTagTest(ServerTestCase):
+
+    def setUp(self):
+        self.cache = nPost.OGCache()
+        self.npost = self.npost(og_cache=self.cache)
+
+    def test_fresh_entry_is_not_fetched_again(self):
+        url = self.url('/article/fresh')
+        requests = self.count('article')
+
+        first = self.npost.get_related_article_meta_tag(url)
+        second = self.npost.get_related_article_meta_tag(url)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first['og:title'], '관련기사 fresh')
+        self.assertEqual(self.count('article') - requests, 1)
+
+    def test_stale_entry_is_revalidated(self):
+        url = self.url('/article/stale')
+        first = self.npost.get_related_article_meta_tag(url)
+        requests = self.count('article')
+
+        second = self.npost.get_related_article_meta_tag(url, ttl=0)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.count('article') - requests, 1)
+        self.assertEqual(self.cache.get_stats()['revalidated'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
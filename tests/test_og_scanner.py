@@ -0,0 +1,83 @@
+"""
+OGTagScanner 테스트 (이전 정규식 구현과 결과 비교)
+
+사용법::
+
+    python -m pytest tests
+"""
+import re
+import unittest
+
+from support import nPost
+from mock_naver import ARTICLE_HTML
+
+PAGES = [
+    ARTICLE_HTML.format(n=1, body='<p>본문</p>'),
+    '<html><head><meta property="og:title" content="A &amp; B &lt;C&gt;">'
+    '<meta property="og:description" content="&quot;인용&quot; &#39;작은따옴표&#39;"></head></html>',
+    '<html><head><meta property="og:title" content="">'
+    '<meta property="og:url" content="http://example.com/?a=1&amp;b=2"></head><body></body></html>',
+    '<html><head><meta name="og:title" content="name 속성"><meta name="description" content="x">'
+    '<meta property="og:title" content="property 속성"></head></html>',
+]
+
+
+def legacy_parse(html):
+    """
+    이전 구현 (get_related_article_meta_tag 의 정규식)
+    """
+    tags = re.findall(r'<\s*meta\s+property="(og:[^"]+)"\s+content="([^"]*)', html)
+
+    return dict(tags)
+
+
+def scan(html, chunk_size=7, charset='utf-8'):
+    scanner = nPost.OGTagScanner(charset)
+    data = html.encode(charset)
+    for offset in range(0, len(data), chunk_size):
+        if scanner.feed_bytes(data[offset:offset + chunk_size]):
+            break
+
+    return scanner.close()
+
+
+class OGTagScannerTest(unittest.TestCase):
+
+    def test_same_as_legacy_regex(self):
+        for html in PAGES:
+            with self.subTest(html=html[:60]):
+                self.assertEqual(scan(html), legacy_parse(html))
+
+    def test_character_references_are_kept(self):
+        tags = scan(PAGES[1])
+
+        self.assertEqual(tags['og:title'], 'A &amp; B &lt;C&gt;')
+
+    def test_name_attribute_is_ignored(self):
+        self.assertEqual(scan(PAGES[3]), {'og:title': 'property 속성'})
+
+    def test_attribute_order_and_quotes(self):
+        # 이전 정규식은 찾지 못하던 형태
+        html = ("<head><META content='작은 따옴표' property='og:title'>"
+                '<meta\n  property=og:url content="http://example.com/1" /></head>')
+
+        self.assertEqual(scan(html), {'og:title': '작은 따옴표', 'og:url': 'http://example.com/1'})
+
+    def test_stops_at_head(self):
+        scanner = nPost.OGTagScanner('utf-8')
+
+        self.assertTrue(scanner.feed_bytes(b'<head><meta property="og:title" content="a"></head>'))
+        self.assertTrue(scanner.feed_bytes(b'<meta property="og:url" content="b">'))
+        self.assertEqual(scanner.close(), {'og:title': 'a'})
+
+    def test_meta_charset(self):
+        html = '<head><meta charset="euc-kr"><meta property="og:title" content="한글 제목"></head>'
+
+        self.assertEqual(scan(html, charset='euc-kr'), {'og:title': '한글 제목'})
+        scanner = nPost.OGTagScanner()
+        scanner.feed_bytes(html.encode('euc-kr'))
+        self.assertEqual(scanner.close(), {'og:title': '한글 제목'})
+
+
+if __name__ == '__main__':
+    unittest.main()
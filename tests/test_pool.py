@@ -0,0 +1,95 @@
+"""
+NPOSTPool 테스트 (채널별 동시 작업 수와 통계)
+
+사용법::
+
+    python -m pytest tests
+"""
+import unittest
+
+from support import nPost, ServerTestCase
+
+LATENCY = 0.2
+
+
+class NPOSTPoolTest(ServerTestCase):
+
+    server_options = {'latency': {'writePost': LATENCY}}
+
+    def setUp(self):
+        self.pool = nPost.NPOSTPool(workers=4, max_pending=8,
+                                    endpoints=nPost.EndpointRegistry(base_url=self.base_url))
+        self.addCleanup(self.pool.close)
+        self.pool.add_account('a', 'user_a', 'pw', max_concurrency=1)
+        self.pool.add_account('b', 'user_b', 'pw')
+
+    def job(self, channel, n):
+        return nPost.PublishJob('{}', nPost.Document('제목 %d' % n, [nPost.Paragraph('본문')]), job_id=n,
+                                channel=channel)
+
+    def channel_stats(self, channel):
+        return self.pool.get_stats()['channels'][channel]
+
+    def test_duplicate_channel(self):
+        with self.assertRaises(ValueError):
+            self.pool.add_account('a', 'user_a', 'pw')
+
+    def test_channel_concurrency(self):
+        futures = [self.pool.submit(self.job('a', n)) for n in range(3)]
+        stats = self.channel_stats('a')
+        self.assertEqual((stats['active'], stats['queued']), (1, 2))
+
+        # 'a' 의 작업이 밀려 있어도 'b' 의 작업은 바로 처리된다
+        result = self.pool.submit(self.job('b', 3)).result()
+        self.assertTrue(result.ok)
+        self.assertEqual(result.channel, 'b')
+        self.assertFalse(futures[-1].done())
+
+        results = [future.result() for future in futures]
+        self.assertTrue(all(result.ok and result.channel == 'a' for result in results))
+        # 채널 'a' 는 한번에 하나씩 처리한다
+        self.assertGreaterEqual(results[-1].elapsed, 3 * LATENCY * 0.9)
+
+    def test_stats(self):
+        jobs = [self.job(channel, n) for n, channel in enumerate('abab')]
+
+        results = list(self.pool.drain(jobs))
+
+        self.assertEqual(sorted(result.job_id for result in results), [0, 1, 2, 3])
+        stats = self.pool.get_stats()
+        for channel in 'ab':
+            self.assertEqual(stats['channels'][channel],
+                             {'succeeded': 2, 'failed': 0, 'logins': 1, 'active': 0, 'queued': 0})
+        self.assertGreaterEqual(stats['p50'], LATENCY * 0.9)
+        self.assertGreaterEqual(stats['p99'], stats['p50'])
+
+    def test_refresh(self):
+        self.pool.submit(self.job('a', 0)).result()
+        self.pool.refresh('a')
+        self.pool.submit(self.job('a', 1)).result()
+
+        self.assertEqual(self.channel_stats('a')['logins'], 2)
+        self.assertIs(self.pool.session('a'), self.pool.session('a'))
+
+    def test_failed_job(self):
+        self.server.error_rate = {'writePost': 1.0}
+        self.addCleanup(setattr, self.server, 'error_rate', 0.0)
+
+        result = self.pool.submit(self.job('a', 0)).result()
+
+        self.assertFalse(result.ok)
+        self.assertEqual(self.channel_stats('a')['failed'], 1)
+
+    def test_full(self):
+        pool = nPost.NPOSTPool(workers=1, max_pending=1, endpoints=nPost.EndpointRegistry(base_url=self.base_url))
+        self.addCleanup(pool.close)
+        pool.add_account('a', 'user_a', 'pw')
+
+        future = pool.submit(self.job('a', 0))
+        with self.assertRaises(TimeoutError):
+            pool.submit(self.job('a', 1), timeout=0.01)
+        self.assertTrue(future.result().ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+RateLimiter, TokenBucket 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import time
+import unittest
+import urllib.error
+
+from support import nPost, ServerTestCase
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        bucket = nPost.TokenBucket(10, burst=3)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0] * 3)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_paused(self):
+        bucket = nPost.TokenBucket(10)
+        bucket.paused_until = time.monotonic() + 5
+
+        self.assertGreater(bucket.reserve(), 4.9)
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = nPost.RateLimiter({'writePost': 8, 'upload': (4, 2)}, cooldown=0)
+
+    def rate(self, endpoint='writePost'):
+        return self.limiter.get_stats()[endpoint]['rate']
+
+    def test_buckets(self):
+        self.assertIsNone(self.limiter.bucket('prePost'))
+        self.assertIsNone(self.limiter.bucket(None))
+        self.assertEqual(self.limiter.bucket('upload').burst, 2)
+        self.assertIs(self.limiter.bucket('upload'), self.limiter.bucket('upload'))
+        self.assertIsNotNone(nPost.RateLimiter(default=1).bucket('prePost'))
+
+    def test_multiplicative_decrease(self):
+        for status, rate in ((503, 4), (429, 2), (None, 1)):
+            self.limiter.feedback('writePost', status, 0.1)
+            self.assertEqual(self.rate(), rate)
+
+    def test_slow_response_decreases(self):
+        self.limiter.feedback('writePost', 200, self.limiter.slow)
+
+        self.assertEqual(self.rate(), 4)
+
+    def test_min_rate(self):
+        for _ in range(10):
+            self.limiter.feedback('writePost', 503, 0.1)
+
+        self.assertEqual(self.rate(), self.limiter.min_rate)
+
+    def test_additive_increase(self):
+        self.limiter.feedback('writePost', 503, 0.1)
+        for _ in range(5):
+            self.limiter.feedback('writePost', 200, 0.1)
+        self.assertAlmostEqual(self.rate(), 4.5)
+
+        for _ in range(100):
+            self.limiter.feedback('writePost', 200, 0.1)
+        self.assertEqual(self.rate(), 8)
+
+    def test_cooldown(self):
+        self.limiter.cooldown = 60
+        self.limiter.feedback('writePost', 503, 0.1)
+        self.limiter.feedback('writePost', 503, 0.1)
+
+        self.assertEqual(self.rate(), 4)
+
+    def test_retry_after(self):
+        self.limiter.feedback('writePost', 503, 0.1, retry_after='3')
+
+        self.assertGreater(self.limiter.bucket('writePost').reserve(), 2.9)
+
+    def test_other_endpoints_are_not_affected(self):
+        self.limiter.bucket('upload')
+        self.limiter.feedback('writePost', 503, 0.1)
+
+        self.assertEqual(self.rate('upload'), 4)
+
+
+class LimitedRequestTest(ServerTestCase):
+
+    def tearDown(self):
+        self.server.error_rate = 0.0
+
+    def test_server_errors_back_off(self):
+        limiter = nPost.RateLimiter({'prePost': 100}, cooldown=0)
+        npost = self.npost(rate_limiter=limiter)
+        url = npost.get_request_url('prePost')
+
+        self.server.error_rate = {'prePost': 1.0}
+        for _ in range(2):
+            with self.assertRaises(urllib.error.HTTPError):
+                npost.request('POST', url, data=b'{}', endpoint='prePost')
+        self.assertEqual(limiter.get_stats()['prePost']['rate'], 25)
+
+        self.server.error_rate = 0.0
+        npost.request('POST', url, data=b'{}', endpoint='prePost').read()
+        self.assertAlmostEqual(limiter.get_stats()['prePost']['rate'], 25.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+RetryPolicy 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import io
+import pickle
+import socket
+import threading
+import unittest
+import http.client
+import urllib.error
+
+from support import nPost
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = nPost.RetryPolicy(retries=2, base_delay=0)
+
+    def http_error(self, code):
+        return urllib.error.HTTPError('http://example.com', code, 'error', {}, None)
+
+    def test_network_errors_are_retried(self):
+        errors = [ConnectionResetError(), TimeoutError(), socket.timeout(), socket.gaierror(),
+                  http.client.RemoteDisconnected(), urllib.error.URLError(ConnectionRefusedError()),
+                  self.http_error(503)]
+        for error in errors:
+            with self.subTest(error=error):
+                self.assertTrue(self.policy.retryable(error))
+
+    def test_local_errors_are_not_retried(self):
+        errors = [FileNotFoundError(), PermissionError(), IsADirectoryError(), ValueError(),
+                  urllib.error.URLError('unknown url type'), urllib.error.URLError(FileNotFoundError()),
+                  self.http_error(404)]
+        for error in errors:
+            with self.subTest(error=error):
+                self.assertFalse(self.policy.retryable(error))
+
+    def test_call(self):
+        calls = []
+
+        def func(error):
+            calls.append(error)
+            raise error
+
+        with self.assertRaises(FileNotFoundError):
+            self.policy.call(None, func, FileNotFoundError())
+        self.assertEqual(len(calls), 1)
+
+        result = nPost.JobResult(1)
+        with self.assertRaises(ConnectionResetError):
+            self.policy.call(result, func, ConnectionResetError())
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(result.retries, 2)
+
+    def test_retries_from_threads(self):
+        result = nPost.JobResult(1)
+
+        def count():
+            for _ in range(1000):
+                result.count_retry()
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(result.retries, 8000)
+        # 프로세스 풀로 전달할 수 있어야 한다
+        self.assertEqual(pickle.loads(pickle.dumps(result)).retries, 8000)
+
+    def test_file_is_rewound(self):
+        reads = []
+
+        def func(f):
+            reads.append(f.read())
+            if len(reads) < 2:
+                raise ConnectionResetError()
+            return reads[-1]
+
+        f = io.BytesIO(b'header body')
+        f.read(7)
+
+        self.assertEqual(self.policy.call(None, func, f), b'body')
+        self.assertEqual(reads, [b'body', b'body'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,322 @@
+"""
+HTTPTransport, AsyncHTTPTransport 테스트 (benchmarks/mock_naver.py 대역 서버 사용)
+
+사용법::
+
+    python -m pytest tests
+"""
+import os
+import time
+import base64
+import asyncio
+import unittest
+import unittest.mock
+import urllib.error
+import http.client
+
+from support import nPost, ServerTestCase
+
+BODY = os.urandom(200 * 1024)
+CHUNKED = b''.join(b'chunk%d;' % n for n in range(50))
+
+
+class HTTPTransportTest(ServerTestCase):
+
+    def setUp(self):
+        self.transport = nPost.HTTPTransport(max_redirects=3)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_content_length_body(self):
+        response = self.transport.request('POST', self.url('/echo'), body=BODY)
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Content-Length'), str(len(BODY)))
+        self.assertEqual(response.read(), BODY)
+
+    def test_chunked_request_body(self):
+        chunks = [BODY[offset:offset + 4096] for offset in range(0, len(BODY), 4096)]
+        response = self.transport.request('POST', self.url('/echo'), body=iter(chunks))
+
+        self.assertEqual(response.read(), BODY)
+
+    def test_chunked_response(self):
+        response = self.transport.request('GET', self.url('/chunked/50'))
+
+        self.assertEqual(response.read(), CHUNKED)
+
+    def test_streamed_chunked_response(self):
+        with self.transport.request('GET', self.url('/chunked/50'), stream=True) as response:
+            data = b''.join(iter(lambda: response.read(7), b''))
+
+        self.assertEqual(data, CHUNKED)
+
+    def test_keep_alive_reuse(self):
+        for _ in range(3):
+            self.transport.request('POST', self.url('/echo'), body=b'x').read()
+
+        stats = self.transport.get_stats()['total']
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['reused'], 2)
+
+    def test_dropped_connection_is_not_reused(self):
+        self.assertEqual(self.transport.request('GET', self.url('/drop')).read(), b'dropped')
+        time.sleep(0.1)
+
+        response = self.transport.request('POST', self.url('/echo'), body=iter([b'x']))
+
+        self.assertEqual(response.read(), b'x')
+        self.assertEqual(self.transport.get_stats()['total']['connections'], 2)
+
+    def test_post_is_not_sent_again_after_hangup(self):
+        self.transport.request('GET', self.url('/echo')).read()
+        before = self.server.counts.get('hangup', 0)
+
+        body = nPost.MultipartEncoder({'userId': 'test'}, [('image', 'a.jpg', BODY, 'image/jpeg')])
+        with self.assertRaises((http.client.HTTPException, ConnectionError)):
+            self.transport.request('POST', self.url('/hangup'), body=body,
+                                   headers={'Content-Length': str(len(body))})
+
+        self.assertEqual(self.server.counts['hangup'] - before, 1)
+
+    def test_get_is_sent_again_after_hangup(self):
+        self.transport.request('GET', self.url('/echo')).read()
+        before = self.server.counts.get('hangup', 0)
+
+        # 새 커넥션에서도 끊기므로 한번만 다시 보낸 후 실패
+        with self.assertRaises((http.client.HTTPException, ConnectionError)):
+            self.transport.request('GET', self.url('/hangup'))
+
+        self.assertEqual(self.server.counts['hangup'] - before, 2)
+
+    def test_redirect(self):
+        response = self.transport.request('GET', self.url('/redirect/3'))
+
+        self.assertEqual(response.url, self.url('/redirect/0'))
+        self.assertEqual(response.read(), b'done')
+
+    def test_redirect_limit(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.transport.request('GET', self.url('/redirect/4'))
+
+        self.assertEqual(context.exception.code, 302)
+        self.assertEqual(context.exception.read(), b'moved')
+
+    def test_http_error(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.transport.request('GET', self.url('/missing'))
+
+        self.assertEqual(context.exception.code, 404)
+
+
+class AsyncHTTPTransportTest(ServerTestCase):
+
+    def run_async(self, func, *args):
+        async def run():
+            transport = nPost.AsyncHTTPTransport(max_redirects=3)
+            try:
+                return await func(transport, *args)
+            finally:
+                await transport.close()
+
+        return asyncio.run(run())
+
+    def request(self, *requests):
+        """
+        requests 를 같은 transport 로 순서대로 보내고 (응답 본문 목록, 커넥션 통계)를 반환한다.
+        """
+        async def send(transport):
+            bodies = []
+            for method, path, options in requests:
+                response = await transport.request(method, self.url(path), **options)
+                bodies.append(await response.read())
+            return bodies, transport.get_stats()['total']
+
+        return self.run_async(send)
+
+    def test_content_length_body(self):
+        bodies, _ = self.request(('POST', '/echo', {'body': BODY}))
+
+        self.assertEqual(bodies, [BODY])
+
+    def test_chunked_request_body(self):
+        async def chunks():
+            for offset in range(0, len(BODY), 4096):
+                yield BODY[offset:offset + 4096]
+
+        class Body:
+            def __aiter__(self):
+                return chunks()
+
+        bodies, _ = self.request(('POST', '/echo', {'body': Body()}))
+
+        self.assertEqual(bodies, [BODY])
+
+    def test_chunked_response(self):
+        bodies, _ = self.request(('GET', '/chunked/50', {}))
+
+        self.assertEqual(bodies, [CHUNKED])
+
+    def test_streamed_chunked_response(self):
+        async def read(transport):
+            response = await transport.request('GET', self.url('/chunked/50'), stream=True)
+            parts = []
+            while True:
+                data = await response.read(7)
+                if not data:
+                    return b''.join(parts)
+                parts.append(data)
+
+        self.assertEqual(self.run_async(read), CHUNKED)
+
+    def test_keep_alive_reuse(self):
+        _, stats = self.request(*[('POST', '/echo', {'body': b'x'})] * 3)
+
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['reused'], 2)
+
+    def test_dropped_connection_is_not_reused(self):
+        async def send(transport):
+            await (await transport.request('GET', self.url('/drop'))).read()
+            await asyncio.sleep(0.1)
+            response = await transport.request('POST', self.url('/echo'), body=iter([b'x']))
+            return await response.read(), transport.get_stats()['total']['connections']
+
+        self.assertEqual(self.run_async(send), (b'x', 2))
+
+    def test_post_is_not_sent_again_after_hangup(self):
+        before = self.server.counts.get('hangup', 0)
+
+        with self.assertRaises((http.client.HTTPException, ConnectionError, asyncio.IncompleteReadError)):
+            self.request(('GET', '/echo', {}), ('POST', '/hangup', {'body': b'x' * 1024}))
+
+        self.assertEqual(self.server.counts['hangup'] - before, 1)
+
+    def test_get_is_sent_again_after_hangup(self):
+        before = self.server.counts.get('hangup', 0)
+
+        with self.assertRaises((http.client.HTTPException, ConnectionError, asyncio.IncompleteReadError)):
+            self.request(('GET', '/echo', {}), ('GET', '/hangup', {}))
+
+        self.assertEqual(self.server.counts['hangup'] - before, 2)
+
+    def test_connection_timings(self):
+        finished = []
+
+        class Observer(nPost.RequestObserver):
+            def request_finished(self, stats):
+                finished.append(stats.as_dict())
+
+        async def send(transport):
+            transport.add_observer(Observer())
+            for _ in range(2):
+                await (await transport.request('POST', self.url('/echo'), body=b'x')).read()
+
+        self.run_async(send)
+
+        self.assertEqual([stats['reused'] for stats in finished], [False, True])
+        self.assertGreater(finished[0]['connect'], 0)
+        self.assertEqual(finished[0]['tls'], 0)
+        self.assertEqual(finished[1]['connect'], 0)
+
+    def test_redirect(self):
+        bodies, _ = self.request(('GET', '/redirect/3', {}))
+
+        self.assertEqual(bodies, [b'done'])
+
+    def test_redirect_limit(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.request(('GET', '/redirect/4', {}))
+
+        self.assertEqual(context.exception.code, 302)
+        self.assertEqual(context.exception.read(), b'moved')
+
+
+class ProxyTest(ServerTestCase):
+    """
+    대역 서버를 프록시로 사용 (absolute-form 요청은 경로로 처리하고 CONNECT 는 터널 연결)
+    """
+
+    def proxied(self, *requests):
+        before = len(self.server.proxied)
+        transport = nPost.HTTPTransport(**self.options)
+        try:
+            bodies = [transport.request(method, url, body=body).read() for method, url, body in requests]
+        finally:
+            transport.close()
+
+        return bodies, self.server.proxied[before:]
+
+    def proxied_async(self, *requests):
+        async def send():
+            transport = nPost.AsyncHTTPTransport(**self.options)
+            try:
+                return [await (await transport.request(method, url, body=body)).read()
+                        for method, url, body in requests]
+            finally:
+                await transport.close()
+
+        before = len(self.server.proxied)
+        bodies = asyncio.run(send())
+
+        return bodies, self.server.proxied[before:]
+
+    def setUp(self):
+        self.options = {'proxies': {'http': self.base_url}}
+
+    def test_http_proxy(self):
+        for send in (self.proxied, self.proxied_async):
+            with self.subTest(send=send.__name__):
+                bodies, proxied = send(('POST', 'http://example.invalid/echo', b'x'),
+                                       ('GET', 'http://example.invalid:8080/chunked/2', None))
+
+                self.assertEqual(bodies, [b'x', b'chunk0;chunk1;'])
+                self.assertEqual(proxied, [('POST', 'http://example.invalid/echo', 'example.invalid', None),
+                                           ('GET', 'http://example.invalid:8080/chunked/2',
+                                            'example.invalid:8080', None)])
+
+    def test_proxy_authorization(self):
+        host, port = self.server.server_address[:2]
+        self.options = {'proxies': {'http': 'user:pa%%20ss@%s:%d' % (host, port)}}
+        expected = 'Basic ' + base64.b64encode(b'user:pa ss').decode('ascii')
+
+        for send in (self.proxied, self.proxied_async):
+            with self.subTest(send=send.__name__):
+                _, proxied = send(('GET', 'http://example.invalid/echo', None))
+
+                self.assertEqual(proxied[0][3], expected)
+
+    def test_no_proxy(self):
+        self.options = {'proxies': {'http': 'http://127.0.0.1:9', 'no': 'localhost,127.0.0.1'}}
+
+        for send in (self.proxied, self.proxied_async):
+            with self.subTest(send=send.__name__):
+                self.assertEqual(send(('POST', self.url('/echo'), b'x')), ([b'x'], []))
+
+    def test_environment(self):
+        environ = {name: value for name, value in os.environ.items() if not name.lower().endswith('_proxy')}
+        self.options = {}
+
+        with unittest.mock.patch.dict(os.environ, dict(environ, http_proxy=self.base_url), clear=True):
+            _, proxied = self.proxied(('GET', 'http://example.invalid/echo', None))
+        self.assertEqual(len(proxied), 1)
+
+        environ.update(http_proxy='http://127.0.0.1:9', no_proxy='127.0.0.1')
+        with unittest.mock.patch.dict(os.environ, environ, clear=True):
+            self.assertEqual(self.proxied(('POST', self.url('/echo'), b'x')), ([b'x'], []))
+
+    def test_tunnel_failure(self):
+        self.options = {'proxies': {'https': self.base_url}}
+
+        for send in (self.proxied, self.proxied_async):
+            with self.subTest(send=send.__name__):
+                before = len(self.server.proxied)
+                with self.assertRaisesRegex(OSError, 'Tunnel connection failed: 502'):
+                    send(('GET', 'https://127.0.0.1:1/echo', None))
+
+                self.assertEqual(self.server.proxied[before][:2], ('CONNECT', '127.0.0.1:1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+NPOST.update_post, AsyncNPOST.update_post 테스트 (변경이 없으면 요청하지 않음)
+
+사용법::
+
+    python -m pytest tests
+"""
+import asyncio
+import unittest
+
+from support import nPost, ServerTestCase
+
+PARAGRAPHS = ['문단 %d' % n for n in range(5)]
+
+
+def build(images, videos, links, paragraphs=PARAGRAPHS):
+    document = nPost.Document('제목', [nPost.Paragraph(text) for text in paragraphs])
+    document.extend(nPost.Image.from_upload(image) for image in images)
+    document.extend(nPost.Video.tvcast(video) for video in videos)
+    document.extend(nPost.OgLink.from_tags(tags) for tags in links)
+
+    return document
+
+
+class UpdatePostTest(ServerTestCase):
+
+    def setUp(self):
+        self.store = nPost.ManifestStore()
+        self.npost = self.npost(manifest_store=self.store)
+        self.assets = ([self.url('/image/1.jpg'), b'\xff\xd8\xff\xe0image'], ['http://tv.naver.com/v/1'],
+                       [self.url('/article/1')])
+
+    def requests(self):
+        return sum(self.server.counts.values())
+
+    def update(self, content=build, assets=None):
+        result = nPost.JobResult('1')
+        before = self.requests()
+        response = self.npost.update_post('1', '{}', content, *(assets or self.assets), result=result)
+
+        return response, result.diff, self.requests() - before
+
+    def test_identical_update_sends_nothing(self):
+        response, diff, requests = self.update()
+        self.assertIsNotNone(response)
+        self.assertEqual(diff['fetched'], 4)
+        self.assertGreater(requests, 0)
+
+        response, diff, requests = self.update()
+        self.assertIsNone(response)
+        self.assertFalse(diff['changed'])
+        self.assertEqual(diff['reused'], 4)
+        self.assertEqual(requests, 0)
+
+    def test_changed_block_reuses_assets(self):
+        self.update()
+        updates, prefilters = self.count('updatePost'), self.count('prePost')
+
+        def changed(images, videos, links):
+            return build(images, videos, links, PARAGRAPHS[:-1] + ['바뀐 문단'])
+
+        response, diff, requests = self.update(changed)
+
+        self.assertIsNotNone(response)
+        self.assertTrue(diff['changed'])
+        self.assertEqual((diff['fetched'], diff['reused']), (0, 4))
+        self.assertEqual(self.count('updatePost') - updates, 1)
+        self.assertEqual(self.count('prePost') - prefilters, 1)
+        self.assertEqual(requests, 2)
+
+    def test_string_content(self):
+        content = '{"document": {"title": "제목"}}'
+
+        self.assertIsNotNone(self.update(content, ([], [], []))[0])
+        self.assertEqual(self.update(content, ([], [], []))[2], 0)
+
+    def test_chunk_content(self):
+        chunks = ['{"document": ', '{"title": "제목"}}']
+        size = len(''.join(chunks).encode('euc-kr'))
+
+        response, _, _ = self.update(iter(chunks), ([], [], []))
+        self.assertEqual(response['result']['size'], size)
+
+        # 조각 단위로 해시하므로 나누는 위치가 달라도 같은 내용이면 같은 본문으로 본다
+        self.assertEqual(self.update(''.join(chunks), ([], [], []))[2], 0)
+        body = nPost.EncodedBody(iter(['{"docu', 'ment": {"title": "제목"}}']))
+        self.assertEqual(self.update(body, ([], [], []))[2], 0)
+
+
+class AsyncUpdatePostTest(ServerTestCase):
+
+    def test_identical_update_sends_nothing(self):
+        store = nPost.ManifestStore()
+        assets = ([self.url('/image/1.jpg')], ['http://tv.naver.com/v/1'], [self.url('/article/1')])
+
+        async def update():
+            npost = nPost.AsyncNPOST('test', 'test', endpoints=nPost.EndpointRegistry(base_url=self.base_url),
+                                     manifest_store=store)
+            try:
+                responses = []
+                for _ in range(2):
+                    before = sum(self.server.counts.values())
+                    response = await npost.update_post('1', '{}', build, *assets)
+                    responses.append((response is not None, sum(self.server.counts.values()) - before))
+                return responses
+            finally:
+                await npost.close()
+
+        (first, first_requests), (second, second_requests) = asyncio.run(update())
+
+        self.assertTrue(first)
+        self.assertGreater(first_requests, 0)
+        self.assertFalse(second)
+        self.assertEqual(second_requests, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+UploadCache 테스트
+
+사용법::
+
+    python -m pytest tests
+"""
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+from support import nPost, ServerTestCase
+
+ITEM = {'url': '/a.jpg', 'width': '1200', 'height': '800', 'fileName': 'a.jpg', 'thumbnail': '/a.jpg',
+        'fileSize': '100', 'naCaption': None}
+
+
+class UploadCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'uploads.sqlite')
+        self.cache = nPost.UploadCache(self.path, max_entries=2, max_age=60)
+        self.addCleanup(self.cache.close)
+
+    def age(self, digest, seconds):
+        self.cache._db.execute('UPDATE items SET created = created - ?, accessed = accessed - ? WHERE digest = ?',
+                               (seconds, seconds, digest))
+
+    def test_hit_and_miss(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.put('a', nPost.UploadItem(ITEM))
+
+        item = self.cache.get('a')
+
+        self.assertIsInstance(item, nPost.UploadItem)
+        self.assertEqual(item, ITEM)
+        self.assertEqual(self.cache.get_stats(), {'hits': 1, 'misses': 1, 'entries': 1})
+
+    def test_shared_file(self):
+        self.cache.put('a', nPost.UploadItem(ITEM))
+        other = nPost.UploadCache(self.path)
+        self.addCleanup(other.close)
+
+        self.assertEqual(other.get('a'), ITEM)
+
+    def test_expired(self):
+        self.cache.put('a', nPost.UploadItem(ITEM))
+        self.age('a', 61)
+
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_expired_rows_are_pruned(self):
+        self.cache.put('a', nPost.UploadItem(ITEM))
+        self.cache.put_source('http://example.com/a.jpg', 'etag', 'a')
+        self.age('a', 61)
+
+        self.cache.put('b', nPost.UploadItem(ITEM))
+
+        self.assertEqual(self.cache.get_stats()['entries'], 1)
+        self.assertIsNone(self.cache.get_source('http://example.com/a.jpg'))
+
+    def test_least_recently_used_rows_are_pruned(self):
+        for digest in 'abc':
+            self.cache.put(digest, nPost.UploadItem(ITEM))
+            self.age(digest, 10)
+            self.cache.get('a')
+
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertIsNotNone(self.cache.get('c'))
+
+    def test_source(self):
+        self.cache.put_source('http://example.com/a.jpg', 'etag', 'a')
+        self.assertEqual(self.cache.get_source('http://example.com/a.jpg'), ('etag', 'a', False))
+
+        self.cache.url_ttl = 0
+        self.assertEqual(self.cache.get_source('http://example.com/a.jpg'), ('etag', 'a', True))
+
+
+class CachedUploadTest(ServerTestCase):
+
+    def setUp(self):
+        self.cache = nPost.UploadCache()
+        self.addCleanup(self.cache.close)
+        self.npost = self.npost(upload_cache=self.cache)
+
+    def test_same_bytes_are_uploaded_once(self):
+        data = b'\xff\xd8\xff\xe0' + os.urandom(1024)
+        uploads = self.count('upload')
+
+        first = self.npost.send_image_file(data)
+        second = self.npost.send_image_file(bytearray(data))
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.count('upload') - uploads, 1)
+
+    def test_url_is_not_fetched_again_within_ttl(self):
+        url = self.url('/image/cached-%f.jpg' % time.time())
+        downloads, uploads = self.count('image'), self.count('upload')
+
+        first = self.npost.send_image_file(url)
+        second = self.npost.send_image_file(url)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.count('image') - downloads, 1)
+        self.assertEqual(self.count('upload') - uploads, 1)
+
+    def test_stale_url_is_checked_but_not_uploaded_again(self):
+        self.cache.url_ttl = 0
+        url = self.url('/image/stale-%f.jpg' % time.time())
+        downloads, uploads = self.count('image'), self.count('upload')
+
+        self.npost.send_image_file(url)
+        self.npost.send_image_file(url)
+
+        self.assertEqual(self.count('image') - downloads, 2)
+        self.assertEqual(self.count('upload') - uploads, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()